@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import json
 from collections.abc import Awaitable, Callable
 
@@ -11,6 +12,7 @@ import websockets
 from websockets.asyncio.server import ServerConnection
 
 from mozhi_agent.models import EncryptedAudioPacket, PairingRequest
+from mozhi_agent.observability.profiling import SamplingProfiler
 from mozhi_agent.security.pairing import PairingManager, SessionContext, TransportCrypto
 
 logger = structlog.get_logger(__name__)
@@ -27,10 +29,14 @@ class AudioIngressServer:
         pairing: PairingManager,
         on_audio: AudioCallback,
         on_flush: FlushCallback | None = None,
+        profiler: SamplingProfiler | None = None,
+        profile_max_duration_s: float = 120.0,
     ) -> None:
         self._pairing = pairing
         self._on_audio = on_audio
         self._on_flush = on_flush
+        self._profiler = profiler
+        self._profile_max_duration_s = profile_max_duration_s
 
     async def handler(self, websocket: ServerConnection) -> None:
         """Websocket lifecycle entrypoint."""
@@ -60,6 +66,11 @@ class AudioIngressServer:
                     await self._on_flush()
                 await websocket.send(json.dumps({"type": "flush_ack"}))
                 continue
+            if event_type == "profile":
+                if session is None:
+                    session = self._pairing.validate_token(message.get("token", ""))
+                await self._handle_profile(websocket, message, session)
+                continue
 
     async def _handle_pairing(self, websocket: ServerConnection, message: dict) -> SessionContext:
         req = PairingRequest.model_validate(message["payload"])
@@ -76,12 +87,64 @@ class AudioIngressServer:
         logger.info("pairing.completed", device_id=req.device_id, device_name=req.device_name)
         return session
 
+    async def _handle_profile(
+        self, websocket: ServerConnection, message: dict, session: SessionContext | None,
+    ) -> None:
+        """Admin control: start/stop the sampling profiler.
+
+        Requires a paired session token, a loopback peer, and no ``Origin``
+        header so that browser pages on the same machine cannot drive it.
+        """
+        allowed = (
+            self._profiler is not None
+            and session is not None
+            and _is_loopback(websocket)
+            and not _has_origin(websocket)
+        )
+        if not allowed:
+            logger.warning("profile.rejected", remote=str(websocket.remote_address))
+            await websocket.send(json.dumps({"type": "error", "message": "forbidden"}))
+            return
+        action = message.get("action", "start")
+        try:
+            if action == "start":
+                duration_s = float(message.get("duration_s", 10.0))
+                duration_s = max(0.1, min(duration_s, self._profile_max_duration_s))
+                output = self._profiler.start(duration_s)
+            elif action == "stop":
+                loop = asyncio.get_running_loop()
+                output = await loop.run_in_executor(None, self._profiler.stop)
+            else:
+                await websocket.send(json.dumps({"type": "error", "message": "invalid_action"}))
+                return
+        except (TypeError, ValueError, RuntimeError) as exc:
+            await websocket.send(json.dumps({"type": "error", "message": str(exc)}))
+            return
+        await websocket.send(
+            json.dumps({"type": "profile_ack", "action": action, "output": str(output or "")})
+        )
+
     async def _handle_audio_packet(self, message: dict, session: SessionContext) -> None:
         packet = EncryptedAudioPacket.model_validate(message["payload"])
         plaintext = TransportCrypto.decrypt(session.aes_key, packet.nonce, packet.ciphertext)
         await self._on_audio(plaintext)
 
 
+def _is_loopback(websocket: ServerConnection) -> bool:
+    remote = websocket.remote_address
+    if not remote:
+        return False
+    try:
+        return ipaddress.ip_address(remote[0]).is_loopback
+    except ValueError:
+        return False
+
+
+def _has_origin(websocket: ServerConnection) -> bool:
+    request = websocket.request
+    return request is not None and request.headers.get("Origin") is not None
+
+
 async def run_server(host: str, port: int, server: AudioIngressServer) -> None:
     """Start audio server and run forever."""
     async with websockets.serve(server.handler, host, port, max_size=2**22):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,6 +16,11 @@ class AgentSettings(BaseSettings):
 
     env: str = "development"
     log_level: str = "INFO"
+    log_async: bool = True
+    log_queue_size: int = 10000
+    log_transcript_mode: Literal["full", "truncate", "redact"] = "full"
+    log_transcript_max_chars: int = 80
+    log_rate_limit_per_second: int = 0
     debug: bool = False
 
     bind_host: str = "0.0.0.0"
@@ -25,11 +31,29 @@ class AgentSettings(BaseSettings):
     model_size: str = "small"
     compute_type: str = "int8"
     language: str = "en"
+    batch_size: int = 8
+    beam_size: int = 5
+    max_temperature_fallbacks: int = 2
+    temperature_step: float = 0.2
+    compression_ratio_threshold: float = 2.4
+    log_prob_threshold: float = -1.0
+    no_speech_threshold: float = 0.6
+    min_segment_confidence: float = 0.3
+    language_pin_probability: float = 0.8
+    prompt_max_chars: int = Field(default=200, ge=0)
 
     auto_send: bool = True
     require_confirmation: bool = True
 
     action_log_path: Path = Field(default=Path("logs/actions.log"))
 
+    executor_workers: int = 4
+    loop_monitor_interval_ms: int = 100
+    loop_report_interval_s: float = 30.0
+    loop_lag_threshold_ms: int = 250
+    profile_output_dir: Path = Field(default=Path("logs/profiles"))
+    profile_sample_interval_ms: int = 5
+    profile_max_duration_s: float = 120.0
+
 
 settings = AgentSettings()
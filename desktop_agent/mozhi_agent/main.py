@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import structlog
 
@@ -10,7 +14,9 @@ from mozhi_agent.audio.server import AudioIngressServer, run_server
 from mozhi_agent.config import settings
 from mozhi_agent.injection.factory import get_injector
 from mozhi_agent.observability.logging_utils import configure_logging
+from mozhi_agent.observability.profiling import LoopMonitor, SamplingProfiler
 from mozhi_agent.pipeline.bridge import VoiceBridgePipeline
+from mozhi_agent.pipeline.offline import BatchTranscriptionJob, discover_audio_files
 from mozhi_agent.risk.filter import RiskFilter
 from mozhi_agent.security.pairing import PairingManager
 from mozhi_agent.security.pairing_qr import build_pairing_payload, render_pairing_qr
@@ -20,32 +26,116 @@ from mozhi_agent.ui.tray import start_tray
 logger = structlog.get_logger(__name__)
 
 
+def _configure_logging() -> None:
+    configure_logging(
+        settings.log_level,
+        async_mode=settings.log_async,
+        queue_size=settings.log_queue_size,
+        transcript_mode=settings.log_transcript_mode,
+        transcript_max_chars=settings.log_transcript_max_chars,
+        rate_limit_per_second=settings.log_rate_limit_per_second,
+    )
+
+
+def _build_transcriber(cpu_threads: int = 0) -> WhisperTranscriber:
+    return WhisperTranscriber(
+        model_size=settings.model_size,
+        compute_type=settings.compute_type,
+        language=settings.language,
+        cpu_threads=cpu_threads,
+        beam_size=settings.beam_size,
+        max_temperature_fallbacks=settings.max_temperature_fallbacks,
+        temperature_step=settings.temperature_step,
+        compression_ratio_threshold=settings.compression_ratio_threshold,
+        log_prob_threshold=settings.log_prob_threshold,
+        no_speech_threshold=settings.no_speech_threshold,
+        min_segment_confidence=settings.min_segment_confidence,
+        language_pin_probability=settings.language_pin_probability,
+    )
+
+
 async def _async_main() -> None:
-    configure_logging(settings.log_level)
+    _configure_logging()
     logger.info("agent.starting", env=settings.env, debug=settings.debug)
     start_tray()
 
+    executor = ThreadPoolExecutor(
+        max_workers=settings.executor_workers, thread_name_prefix="mozhi-worker",
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    monitor = LoopMonitor(
+        executor,
+        interval_s=settings.loop_monitor_interval_ms / 1000,
+        report_interval_s=settings.loop_report_interval_s,
+        lag_threshold_s=settings.loop_lag_threshold_ms / 1000,
+    )
+    monitor_task = asyncio.create_task(monitor.run())
+    profiler = SamplingProfiler(
+        settings.profile_output_dir, interval_s=settings.profile_sample_interval_ms / 1000,
+    )
+
     pairing = PairingManager(token_ttl_seconds=settings.token_ttl_seconds)
 
     payload = build_pairing_payload(settings, pairing)
     render_pairing_qr(payload)
     logger.info("pairing.qr_displayed", ws_url=payload["ws_url"])
 
-    transcriber = WhisperTranscriber(
-        model_size=settings.model_size,
-        compute_type=settings.compute_type,
-        language=settings.language,
-    )
+    transcriber = _build_transcriber()
     risk_filter = RiskFilter(settings.action_log_path, settings.require_confirmation)
     injector = get_injector()
     pipeline = VoiceBridgePipeline(settings, transcriber, risk_filter, injector)
 
-    server = AudioIngressServer(pairing, pipeline.handle_audio, on_flush=pipeline.flush_buffer)
-    await run_server(settings.bind_host, settings.bind_port, server)
+    server = AudioIngressServer(
+        pairing,
+        pipeline.handle_audio,
+        on_flush=pipeline.flush_buffer,
+        profiler=profiler,
+        profile_max_duration_s=settings.profile_max_duration_s,
+    )
+    try:
+        await run_server(settings.bind_host, settings.bind_port, server)
+    finally:
+        monitor_task.cancel()
+
+
+def _transcribe_main(args: argparse.Namespace) -> None:
+    _configure_logging()
+    transcriber = _build_transcriber(cpu_threads=args.cpu_threads)
+    risk_filter = RiskFilter(settings.action_log_path, settings.require_confirmation)
+    job = BatchTranscriptionJob(
+        transcriber,
+        risk_filter,
+        batch_size=args.batch_size,
+        decode_workers=args.decode_workers,
+    )
+    job.run(discover_audio_files(args.input), args.output, resume=args.resume)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mozhi-agent", description="Mozhi desktop voice bridge.")
+    commands = parser.add_subparsers(dest="command")
+    transcribe = commands.add_parser(
+        "transcribe", help="Batch-transcribe recorded audio files to JSONL with risk decisions.",
+    )
+    transcribe.add_argument("input", type=Path, help="Audio file or folder to scan recursively.")
+    transcribe.add_argument(
+        "-o", "--output", type=Path, default=Path("transcripts.jsonl"), help="JSONL output path.",
+    )
+    transcribe.add_argument(
+        "--resume", action="store_true", help="Skip files already present in the output.",
+    )
+    transcribe.add_argument("--batch-size", type=int, default=settings.batch_size)
+    transcribe.add_argument("--decode-workers", type=int, default=2)
+    transcribe.add_argument("--cpu-threads", type=int, default=os.cpu_count() or 0)
+    return parser
 
 
 def run() -> None:
     """Console script runner."""
+    args = _build_parser().parse_args()
+    if args.command == "transcribe":
+        _transcribe_main(args)
+        return
     asyncio.run(_async_main())
 
 
@@ -38,6 +38,8 @@ class TranscriptEvent(BaseModel):
     text: str
     confidence: float = Field(ge=0.0, le=1.0)
     latency_ms: int
+    language: str | None = None
+    skipped_segments: int = 0
 
 
 class RiskDecision(BaseModel):
@@ -48,6 +50,18 @@ class RiskDecision(BaseModel):
     keyword: str | None = None
 
 
+class BatchTranscriptRecord(BaseModel):
+    """One JSONL result line produced by offline batch transcription."""
+
+    path: str
+    text: str = ""
+    confidence: float = Field(default=0.0, ge=0.0, le=1.0)
+    latency_ms: int = 0
+    duration_s: float = 0.0
+    decision: RiskDecision | None = None
+    error: str | None = None
+
+
 class ActionLogEntry(BaseModel):
     """Audit log item for all user-impacting actions."""
 
@@ -2,27 +2,218 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import time
+from typing import Any, Literal, TextIO
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, see the `fast-logging` extra
+    orjson = None
+
+TranscriptMode = Literal["full", "truncate", "redact"]
+
+# Event keys carrying user speech; see TranscriptRedactor.
+TRANSCRIPT_KEYS = ("text", "transcript")
+
+
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    """JSON serializer for JSONRenderer, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=kwargs.get("default", str), option=orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(obj, **kwargs)
+
+
+class TranscriptRedactor:
+    """Processor that truncates or redacts transcript text before rendering."""
+
+    def __init__(self, mode: TranscriptMode, max_chars: int = 80) -> None:
+        self._mode = mode
+        self._max_chars = max_chars
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        for key in TRANSCRIPT_KEYS:
+            value = event_dict.get(key)
+            if not isinstance(value, str):
+                continue
+            if self._mode == "redact":
+                event_dict[key] = "[redacted]"
+                event_dict[f"{key}_chars"] = len(value)
+            elif self._mode == "truncate" and len(value) > self._max_chars:
+                event_dict[key] = value[: self._max_chars] + "…"
+                event_dict[f"{key}_chars"] = len(value)
+        return event_dict
+
+
+class EventRateLimiter:
+    """Processor dropping info/debug events beyond ``max_per_second`` per event name.
+
+    Warnings and errors always pass. The first event emitted in a new
+    window carries ``suppressed=N`` for the events dropped in the previous
+    one. Counters are best-effort across threads; no lock is taken on the
+    hot path.
+    """
+
+    _EXEMPT_LEVELS = frozenset({"warning", "error", "critical", "exception"})
+
+    def __init__(self, max_per_second: int) -> None:
+        self._max_per_second = max_per_second
+        self._windows: dict[str, list[float | int]] = {}
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        if method_name in self._EXEMPT_LEVELS:
+            return event_dict
+        event = str(event_dict.get("event"))
+        now = time.monotonic()
+        window = self._windows.get(event)
+        if window is None or now - window[0] >= 1.0:
+            suppressed = window[2] if window is not None else 0
+            self._windows[event] = [now, 1, 0]
+            if suppressed:
+                event_dict["suppressed"] = suppressed
+            return event_dict
+        if window[1] >= self._max_per_second:
+            window[2] += 1
+            raise structlog.DropEvent
+        window[1] += 1
+        return event_dict
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock ``prepare`` formats the record on the calling thread, which
+    is exactly the work we want off the event loop. ``emit`` never blocks:
+    info/debug records may only fill the queue up to ``reserved`` slots
+    short of its capacity, leaving room for WARNING and above, and anything
+    that still does not fit is dropped. The number dropped is reported as a
+    ``log.records_dropped`` warning ahead of the next record enqueued.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        reserved = max(1, log_queue.maxsize // 10) if log_queue.maxsize > 1 else 0
+        self._info_limit = max(1, log_queue.maxsize - reserved) if log_queue.maxsize > 0 else 0
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # The drop notice only uses unreserved space so it never displaces a warning.
+        if self.dropped and self._has_room() and self._put(self._dropped_record()):
+            self.dropped = 0
+        if record.levelno < logging.WARNING and not self._has_room():
+            self.dropped += 1
+            return
+        if not self._put(record):
+            self.dropped += 1
+
+    def _has_room(self) -> bool:
+        return not self._info_limit or self.queue.qsize() < self._info_limit
+
+    def _put(self, record: logging.LogRecord) -> bool:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            return False
+        return True
+
+    def _dropped_record(self) -> logging.LogRecord:
+        record = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0, "log.records_dropped", None, None,
+        )
+        record.dropped = self.dropped
+        return record
+
+
+# The QueueListener installed by the last async configure_logging call.
+_active_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_active_listener() -> None:
+    """Drain and stop the active listener unless the caller already stopped it."""
+    global _active_listener  # pylint: disable=global-statement
+    listener, _active_listener = _active_listener, None
+    if listener is not None and listener._thread is not None:  # pylint: disable=protected-access
+        listener.stop()
+
+
+atexit.register(_stop_active_listener)
+
+
+def configure_logging(
+    level: str = "INFO",
+    async_mode: bool = False,
+    queue_size: int = 10000,
+    transcript_mode: TranscriptMode = "full",
+    transcript_max_chars: int = 80,
+    rate_limit_per_second: int = 0,
+    stream: TextIO | None = None,
+) -> logging.handlers.QueueListener | None:
+    """Configure stdlib and structlog to emit JSON-like structured events.
+
+    With ``async_mode`` the calling thread only builds the event dict and
+    enqueues it; JSON rendering and the write to ``stream`` happen on a
+    ``QueueListener`` thread, which is returned (and stopped at exit).
+    Reconfiguring stops the listener from a previous call first.
+    """
+    global _active_listener  # pylint: disable=global-statement
+    _stop_active_listener()
+    stream = stream or sys.stdout
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    processors: list[Any] = [
+        structlog.stdlib.filter_by_level,
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+    ]
+    if rate_limit_per_second > 0:
+        processors.append(EventRateLimiter(rate_limit_per_second))
+    processors.append(structlog.processors.TimeStamper(fmt="iso"))
+    processors.append(structlog.processors.format_exc_info)
+    if transcript_mode != "full":
+        processors.append(TranscriptRedactor(transcript_mode, transcript_max_chars))
+    renderer = structlog.processors.JSONRenderer(serializer=_dumps)
+
+    listener: logging.handlers.QueueListener | None = None
+    if async_mode:
+        stream_handler = logging.StreamHandler(stream)
+        stream_handler.setFormatter(
+            structlog.stdlib.ProcessorFormatter(
+                processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, renderer],
+                foreign_pre_chain=[
+                    structlog.stdlib.ExtraAdder(allow=("dropped",)),
+                    structlog.processors.add_log_level,
+                    structlog.processors.TimeStamper(fmt="iso"),
+                ],
+            )
+        )
+        log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        root = logging.getLogger()
+        root.handlers.clear()
+        root.addHandler(_DeferredQueueHandler(log_queue))
+        root.setLevel(log_level)
+        listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        listener.start()
+        _active_listener = listener
+        processors.append(structlog.stdlib.ProcessorFormatter.wrap_for_formatter)
+    else:
+        logging.basicConfig(level=log_level, format="%(message)s", stream=stream, force=True)
+        processors.append(renderer)
 
-def configure_logging(level: str = "INFO") -> None:
-    """Configure stdlib and structlog to emit JSON-like structured events."""
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(message)s",
-        stream=sys.stdout,
-    )
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=processors,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
+    return listener
@@ -0,0 +1,197 @@
+"""On-demand sampling profiler and asyncio event-loop health monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from types import FrameType
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def _collapse_stack(frame: FrameType | None) -> str:
+    """Render a frame chain root-first as a `;`-joined collapsed stack."""
+    parts: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class SamplingProfiler:
+    """Wall-clock sampler writing collapsed stacks for flamegraph tooling.
+
+    Every ``interval_s`` the sampler thread walks ``sys._current_frames()``
+    and counts one hit per thread stack. On stop the counts are written in
+    the ``frame;frame;frame count`` format understood by ``flamegraph.pl``,
+    ``inferno`` and speedscope.
+    """
+
+    def __init__(self, output_dir: Path, interval_s: float = 0.005) -> None:
+        self._output_dir = output_dir
+        self._interval_s = interval_s
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._output_path: Path | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration_s: float) -> Path:
+        """Begin sampling for ``duration_s`` seconds, returning the output path."""
+        with self._lock:
+            if self.running:
+                raise RuntimeError("profiler already running")
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+            self._output_path = self._output_dir / f"profile-{stamp}.folded"
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(duration_s, self._output_path),
+                name="mozhi-profiler",
+                daemon=True,
+            )
+            self._thread.start()
+        logger.info("profiler.started", duration_s=duration_s, output=str(self._output_path))
+        return self._output_path
+
+    def stop(self) -> Path | None:
+        """Stop an active run early and wait for its output to be written."""
+        with self._lock:
+            thread = self._thread
+            self._stop_event.set()
+        if thread is not None:
+            thread.join()
+        return self._output_path
+
+    def _run(self, duration_s: float, output_path: Path) -> None:
+        own_ident = threading.get_ident()
+        samples: Counter[str] = Counter()
+        thread_names: dict[int, str] = {}
+        deadline = time.monotonic() + duration_s
+        sample_count = 0
+        while not self._stop_event.is_set() and time.monotonic() < deadline:
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if ident not in thread_names:
+                    thread_names = {t.ident: t.name for t in threading.enumerate() if t.ident}
+                name = thread_names.get(ident, str(ident))
+                samples[f"{name};{_collapse_stack(frame)}"] += 1
+            sample_count += 1
+            self._stop_event.wait(self._interval_s)
+
+        with output_path.open("w", encoding="utf-8") as handle:
+            for stack, count in samples.most_common():
+                handle.write(f"{stack} {count}\n")
+        logger.info("profiler.stopped", samples=sample_count, output=str(output_path))
+
+
+class LoopMonitor:
+    """Measures event-loop lag and executor backlog, reporting via structlog.
+
+    A heartbeat coroutine sleeps for ``interval_s`` and records how late it
+    wakes up. A watchdog thread watches that heartbeat from outside the loop
+    so that, when the loop is stalled longer than ``lag_threshold_s``, it can
+    capture the loop thread's stack *while* the blocking call is still on it.
+    """
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor | None = None,
+        interval_s: float = 0.1,
+        report_interval_s: float = 30.0,
+        lag_threshold_s: float = 0.25,
+    ) -> None:
+        self._executor = executor
+        self._interval_s = interval_s
+        self._report_interval_s = report_interval_s
+        self._lag_threshold_s = lag_threshold_s
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._max_lag_s = 0.0
+        self._total_lag_s = 0.0
+        self._beats = 0
+        self._stalls = 0
+        # Written by the watchdog thread, read and reset on the loop thread.
+        self._stalls_lock = threading.Lock()
+
+    def executor_queue_depth(self) -> int:
+        """Return the number of work items waiting for an executor thread."""
+        if self._executor is None:
+            return 0
+        return self._executor._work_queue.qsize()  # pylint: disable=protected-access
+
+    async def run(self) -> None:
+        """Run the heartbeat until cancelled."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        watchdog_stop = threading.Event()
+        watchdog = threading.Thread(
+            target=self._watchdog, args=(watchdog_stop,), name="mozhi-loop-watchdog", daemon=True,
+        )
+        watchdog.start()
+        next_report = self._last_beat + self._report_interval_s
+        try:
+            while True:
+                before = time.monotonic()
+                await asyncio.sleep(self._interval_s)
+                now = time.monotonic()
+                self._last_beat = now
+                lag = max(0.0, now - before - self._interval_s)
+                self._max_lag_s = max(self._max_lag_s, lag)
+                self._total_lag_s += lag
+                self._beats += 1
+                if now >= next_report:
+                    self._report()
+                    next_report = now + self._report_interval_s
+        finally:
+            watchdog_stop.set()
+
+    def _report(self) -> None:
+        with self._stalls_lock:
+            stalls, self._stalls = self._stalls, 0
+        logger.info(
+            "loop.health",
+            lag_max_ms=round(self._max_lag_s * 1000, 1),
+            lag_mean_ms=round(self._total_lag_s / max(self._beats, 1) * 1000, 1),
+            executor_queue_depth=self.executor_queue_depth(),
+            stalls=stalls,
+        )
+        self._max_lag_s = 0.0
+        self._total_lag_s = 0.0
+        self._beats = 0
+
+    def _watchdog(self, stop: threading.Event) -> None:
+        stalled_beat: float | None = None
+        while not stop.wait(self._interval_s):
+            beat = self._last_beat
+            stalled_for = time.monotonic() - beat
+            if stalled_for < self._interval_s + self._lag_threshold_s or beat == stalled_beat:
+                continue
+            # One snapshot per stall: wait for a fresh heartbeat before re-arming.
+            stalled_beat = beat
+            with self._stalls_lock:
+                self._stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id or -1)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            logger.warning(
+                "loop.lag_exceeded",
+                stalled_ms=round(stalled_for * 1000, 1),
+                threshold_ms=round(self._lag_threshold_s * 1000, 1),
+                executor_queue_depth=self.executor_queue_depth(),
+                stack=stack,
+            )
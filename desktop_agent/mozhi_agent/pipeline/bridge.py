@@ -12,7 +12,7 @@ from mozhi_agent.config import AgentSettings
 from mozhi_agent.injection.base import BaseInjector
 from mozhi_agent.models import ActionLogEntry
 from mozhi_agent.risk.filter import RiskFilter
-from mozhi_agent.stt.transcriber import WhisperTranscriber
+from mozhi_agent.stt.transcriber import DecodingSession, WhisperTranscriber
 from mozhi_agent.ui.confirm import confirm_injection
 
 logger = structlog.get_logger(__name__)
@@ -26,6 +26,10 @@ class VoiceBridgePipeline:
     the aggregated chunk is sent to the Whisper transcriber.  Call
     ``flush_buffer()`` when a push-to-talk session ends to process the
     remaining audio.
+
+    Within one push-to-talk stream a ``DecodingSession`` pins the detected
+    language and carries the most recently injected text into the next
+    chunk's decoding prompt; ``flush_buffer()`` starts a fresh one.
     """
 
     # 3 seconds of PCM16 mono @ 16 kHz → 16000 samples/s × 2 bytes × 3 s
@@ -43,6 +47,7 @@ class VoiceBridgePipeline:
         self._risk_filter = risk_filter
         self._injector = injector
         self._audio_buffer = bytearray()
+        self._decoding = DecodingSession()
 
     async def handle_audio(self, pcm_bytes: bytes) -> None:
         """Buffer incoming decrypted PCM and transcribe when threshold is met."""
@@ -54,11 +59,16 @@ class VoiceBridgePipeline:
         await self._process_chunk(chunk)
 
     async def flush_buffer(self) -> None:
-        """Transcribe any remaining buffered audio (e.g. on PTT release)."""
+        """Transcribe any remaining buffered audio (e.g. on PTT release).
+
+        This ends the push-to-talk stream, so the decoding context is reset
+        and the next press starts with fresh language detection and prompt.
+        """
         if self._audio_buffer:
             chunk = bytes(self._audio_buffer)
             self._audio_buffer.clear()
             await self._process_chunk(chunk)
+        self._decoding = DecodingSession()
 
     async def _process_chunk(self, pcm_bytes: bytes) -> None:
         """Run STT → risk evaluation → optional confirmation → injection.
@@ -68,9 +78,18 @@ class VoiceBridgePipeline:
         """
         loop = asyncio.get_running_loop()
         transcript = await loop.run_in_executor(
-            None, self._transcriber.transcribe_pcm16_mono, pcm_bytes,
+            None,
+            functools.partial(
+                self._transcriber.transcribe_pcm16_mono, pcm_bytes, session=self._decoding,
+            ),
         )
         if not transcript.text:
+            if transcript.skipped_segments:
+                logger.info(
+                    "stt.skipped",
+                    skipped_segments=transcript.skipped_segments,
+                    latency_ms=transcript.latency_ms,
+                )
             return
 
         self._risk_filter.append_audit(
@@ -86,6 +105,8 @@ class VoiceBridgePipeline:
             text=transcript.text,
             confidence=transcript.confidence,
             latency_ms=transcript.latency_ms,
+            language=transcript.language,
+            skipped_segments=transcript.skipped_segments,
         )
 
         decision = self._risk_filter.evaluate(transcript.text)
@@ -122,3 +143,4 @@ class VoiceBridgePipeline:
                 details=f"auto_send={self._settings.auto_send}",
             )
         )
+        self._decoding.commit(transcript.text, self._settings.prompt_max_chars)
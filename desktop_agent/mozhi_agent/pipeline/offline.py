@@ -0,0 +1,204 @@
+"""Offline batch transcription of recorded voice notes to JSONL."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import structlog
+from faster_whisper import decode_audio
+
+from mozhi_agent.models import BatchTranscriptRecord
+from mozhi_agent.risk.filter import RiskFilter
+from mozhi_agent.stt.transcriber import WhisperTranscriber
+
+logger = structlog.get_logger(__name__)
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".aac", ".ogg", ".opus", ".flac", ".webm")
+_SAMPLE_RATE = 16000
+
+
+@dataclass(slots=True)
+class _LoadedAudio:
+    """A decoded recording cut into VAD speech chunks."""
+
+    duration_s: float
+    chunks: list[np.ndarray]
+
+
+def discover_audio_files(root: Path, extensions: Iterable[str] = AUDIO_EXTENSIONS) -> Iterator[Path]:
+    """Yield audio files under ``root`` in a stable (sorted) order."""
+    if root.is_file():
+        yield root
+        return
+    wanted = {ext.lower() for ext in extensions}
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() in wanted:
+            yield path
+
+
+def load_checkpoint(output_path: Path) -> set[str]:
+    """Compact an existing JSONL output for resuming and return its finished paths.
+
+    Only the last successful record per path is kept. Error records and a
+    torn final line from an interrupted run are removed, since those files
+    are retried and appended again. Paths are compared in resolved form, so
+    the same folder may be given as a relative or an absolute path.
+    """
+    if not output_path.exists():
+        return set()
+    kept: dict[str, str] = {}
+    with output_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("error") is None and "path" in record:
+                kept[str(Path(record["path"]).resolve())] = line.rstrip("\n") + "\n"
+    compacted = output_path.with_name(output_path.name + ".tmp")
+    compacted.write_text("".join(kept.values()), encoding="utf-8")
+    compacted.replace(output_path)
+    return set(kept)
+
+
+class BatchTranscriptionJob:
+    """Streams files from disk through batched Whisper inference and the risk filter.
+
+    Decoding and VAD run on a small thread pool, prefetching ahead of the
+    model. Speech chunks from consecutive files are pooled until they fill
+    ``group_batches`` batches and are then decoded in one batched call, so
+    short voice notes (often a single chunk each) still share full batches
+    instead of running one model call per file. Results are appended and
+    flushed one line per file, with resolved paths, which makes the output
+    itself the resume checkpoint.
+    """
+
+    def __init__(
+        self,
+        transcriber: WhisperTranscriber,
+        risk_filter: RiskFilter,
+        batch_size: int = 8,
+        decode_workers: int = 2,
+        prefetch: int = 8,
+        group_batches: int = 4,
+    ) -> None:
+        self._transcriber = transcriber
+        self._risk_filter = risk_filter
+        self._batch_size = max(1, batch_size)
+        self._decode_workers = decode_workers
+        self._prefetch = max(1, prefetch)
+        self._group_chunks = self._batch_size * max(1, group_batches)
+
+    def run(self, files: Iterable[Path], output_path: Path, resume: bool = False) -> int:
+        """Transcribe ``files`` into ``output_path``, returning the number processed."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        done = load_checkpoint(output_path) if resume else set()
+        resolved = (path.resolve() for path in files)
+        pending = (path for path in resolved if str(path) not in done)
+        if done:
+            logger.info("batch.resumed", skipped=len(done), output=str(output_path))
+
+        started = time.perf_counter()
+        processed = 0
+        failed = 0
+        total_audio_s = 0.0
+        with (
+            output_path.open("a" if resume else "w", encoding="utf-8") as out,
+            ThreadPoolExecutor(self._decode_workers, thread_name_prefix="mozhi-decode") as pool,
+        ):
+            for records in self._transcribe_groups(self._prefetch_decode(pending, pool)):
+                for record in records:
+                    out.write(record.model_dump_json() + "\n")
+                    processed += 1
+                    failed += record.error is not None
+                    total_audio_s += record.duration_s
+                    logger.info(
+                        "batch.file_completed",
+                        path=record.path,
+                        duration_s=record.duration_s,
+                        latency_ms=record.latency_ms,
+                        error=record.error,
+                    )
+                out.flush()
+
+        elapsed_s = time.perf_counter() - started
+        log = logger.warning if failed else logger.info
+        log(
+            "batch.completed",
+            files=processed,
+            failed=failed,
+            audio_s=round(total_audio_s, 1),
+            elapsed_s=round(elapsed_s, 1),
+            realtime_factor=round(total_audio_s / max(elapsed_s, 1e-6), 1),
+        )
+        return processed
+
+    def _load(self, path: Path) -> _LoadedAudio:
+        audio = decode_audio(str(path), sampling_rate=_SAMPLE_RATE)
+        return _LoadedAudio(
+            duration_s=round(len(audio) / _SAMPLE_RATE, 3),
+            chunks=self._transcriber.split_speech(audio),
+        )
+
+    def _prefetch_decode(
+        self, files: Iterator[Path], pool: ThreadPoolExecutor,
+    ) -> Iterator[tuple[Path, Future[_LoadedAudio]]]:
+        """Keep up to ``prefetch`` decodes in flight without materialising the file list."""
+        window: deque[tuple[Path, Future[_LoadedAudio]]] = deque()
+        for path in files:
+            window.append((path, pool.submit(self._load, path)))
+            if len(window) >= self._prefetch:
+                yield window.popleft()
+        while window:
+            yield window.popleft()
+
+    def _transcribe_groups(
+        self, loaded: Iterator[tuple[Path, Future[_LoadedAudio]]],
+    ) -> Iterator[list[BatchTranscriptRecord]]:
+        """Pool decoded files until their chunks fill a group, then decode it."""
+        group: list[tuple[Path, _LoadedAudio]] = []
+        group_chunks = 0
+        for path, future in loaded:
+            try:
+                audio = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("batch.file_failed", path=str(path), error=str(exc))
+                yield [BatchTranscriptRecord(path=str(path), error=str(exc))]
+                continue
+            group.append((path, audio))
+            group_chunks += len(audio.chunks)
+            if group_chunks >= self._group_chunks:
+                yield self._transcribe_group(group)
+                group, group_chunks = [], 0
+        if group:
+            yield self._transcribe_group(group)
+
+    def _transcribe_group(self, group: list[tuple[Path, _LoadedAudio]]) -> list[BatchTranscriptRecord]:
+        try:
+            transcripts = self._transcriber.transcribe_chunks_batched(
+                [audio.chunks for _, audio in group], batch_size=self._batch_size,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("batch.group_failed", files=len(group), error=str(exc))
+            return [BatchTranscriptRecord(path=str(path), error=str(exc)) for path, _ in group]
+        records = []
+        for (path, audio), transcript in zip(group, transcripts):
+            decision = self._risk_filter.evaluate(transcript.text) if transcript.text else None
+            records.append(
+                BatchTranscriptRecord(
+                    path=str(path),
+                    text=transcript.text,
+                    confidence=transcript.confidence,
+                    latency_ms=transcript.latency_ms,
+                    duration_s=audio.duration_s,
+                    decision=decision,
+                )
+            )
+        return records
@@ -2,32 +2,246 @@
 
 from __future__ import annotations
 
+import bisect
 import io
+import math
 import time
 import wave
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.transcribe import Segment
+from faster_whisper.vad import VadOptions, collect_chunks, get_speech_timestamps
 
 from mozhi_agent.models import TranscriptEvent
 
+_SAMPLE_RATE = 16000
+
+
+@dataclass(slots=True)
+class DecodingSession:
+    """Decoder context carried across chunks of one push-to-talk stream.
+
+    ``language`` is filled from the first confident detection and then
+    pinned, and ``prompt`` holds the tail of previously committed text,
+    passed to Whisper as ``initial_prompt`` so chunk boundaries keep their
+    context.
+    """
+
+    language: str | None = None
+    prompt: str = ""
+
+    def commit(self, text: str, max_chars: int) -> None:
+        """Append committed text to the carried prompt, keeping whole words.
+
+        A ``max_chars`` of zero disables prompt carrying.
+        """
+        if max_chars <= 0:
+            self.prompt = ""
+            return
+        prompt = f"{self.prompt} {text}".strip()
+        if len(prompt) > max_chars:
+            prompt = prompt[-max_chars:]
+            prompt = prompt.partition(" ")[2] or prompt
+        self.prompt = prompt
+
 
 class WhisperTranscriber:
-    """Manages whisper model and performs local inference."""
+    """Manages whisper model and performs local inference.
+
+    ``language`` of ``"auto"`` (or empty) enables detection; with a
+    ``DecodingSession`` the detected language is pinned for later chunks once
+    a chunk keeps text and detection reaches ``language_pin_probability``.
+    Temperature fallback is capped at ``max_temperature_fallbacks`` retries
+    of ``temperature_step`` each, since every fallback re-decodes the chunk.
+    """
 
-    def __init__(self, model_size: str, compute_type: str, language: str) -> None:
-        self._model = WhisperModel(model_size, compute_type=compute_type)
-        self._language = language
+    def __init__(
+        self,
+        model_size: str,
+        compute_type: str,
+        language: str,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        beam_size: int = 5,
+        max_temperature_fallbacks: int = 2,
+        temperature_step: float = 0.2,
+        compression_ratio_threshold: float = 2.4,
+        log_prob_threshold: float = -1.0,
+        no_speech_threshold: float = 0.6,
+        min_segment_confidence: float = 0.3,
+        language_pin_probability: float = 0.8,
+    ) -> None:
+        self._model = WhisperModel(
+            model_size, compute_type=compute_type, cpu_threads=cpu_threads, num_workers=num_workers,
+        )
+        self._language = None if language.lower() in ("", "auto") else language
+        self._batched: BatchedInferencePipeline | None = None
+        self._beam_size = beam_size
+        self._temperatures = tuple(
+            round(step * temperature_step, 2) for step in range(max(0, max_temperature_fallbacks) + 1)
+        )
+        self._compression_ratio_threshold = compression_ratio_threshold
+        self._log_prob_threshold = log_prob_threshold
+        self._no_speech_threshold = no_speech_threshold
+        self._min_segment_confidence = min_segment_confidence
+        self._language_pin_probability = language_pin_probability
 
-    def transcribe_pcm16_mono(self, pcm_bytes: bytes, sample_rate: int = 16000) -> TranscriptEvent:
+    def transcribe_pcm16_mono(
+        self,
+        pcm_bytes: bytes,
+        sample_rate: int = 16000,
+        session: DecodingSession | None = None,
+    ) -> TranscriptEvent:
         """Transcribe raw PCM16 mono bytes and return text with latency metadata."""
         start = time.perf_counter()
         wav_bytes = self._pcm_to_wav_bytes(pcm_bytes, sample_rate)
-        segments, info = self._model.transcribe(io.BytesIO(wav_bytes), language=self._language)
-        text = " ".join(segment.text.strip() for segment in segments).strip()
+        language = self._language
+        if session is not None and session.language:
+            language = session.language
+        segments, info = self._model.transcribe(
+            io.BytesIO(wav_bytes),
+            language=language,
+            initial_prompt=(session.prompt or None) if session is not None else None,
+            beam_size=self._beam_size,
+            temperature=self._temperatures,
+            compression_ratio_threshold=self._compression_ratio_threshold,
+            log_prob_threshold=self._log_prob_threshold,
+            no_speech_threshold=self._no_speech_threshold,
+        )
+        event = self._score_segments(segments, info.language, start)
+        # A chunk of silence or noise gives an unreliable guess; leave the
+        # language unpinned so the next chunk detects again.
+        if (
+            session is not None
+            and session.language is None
+            and event.text
+            and info.language_probability >= self._language_pin_probability
+        ):
+            session.language = info.language
+        return event
+
+    @staticmethod
+    def split_speech(audio: np.ndarray, max_chunk_s: float = 30.0) -> list[np.ndarray]:
+        """Cut float32 16 kHz audio into VAD speech chunks of at most ``max_chunk_s``."""
+        vad_options = VadOptions(max_speech_duration_s=max_chunk_s, min_silence_duration_ms=160)
+        timestamps = get_speech_timestamps(audio, vad_options)
+        if not timestamps:
+            return []
+        chunks, _ = collect_chunks(audio, timestamps, max_duration=max_chunk_s)
+        return chunks
+
+    def transcribe_chunks_batched(
+        self, groups: Sequence[Sequence[np.ndarray]], batch_size: int = 8,
+    ) -> list[TranscriptEvent]:
+        """Decode speech chunks of many recordings in shared batches.
+
+        The chunks of every group are laid end to end and passed as
+        ``clip_timestamps``, so each model call is filled with up to
+        ``batch_size`` chunks regardless of which recording they came from.
+        Segments are mapped back to their group by start time. Returns one
+        event per group, in order; ``latency_ms`` is that of the shared call.
+
+        Without a configured language, each group's language is detected
+        from its first chunk and groups are decoded in one call per language,
+        since a batched call decodes every clip in a single language.
+        """
+        if self._batched is None:
+            self._batched = BatchedInferencePipeline(model=self._model)
+        start = time.perf_counter()
+        fixed_language = self._language
+        if fixed_language is None and not self._model.model.is_multilingual:
+            fixed_language = "en"
+        by_language: dict[str | None, list[int]] = {}
+        for index, chunks in enumerate(groups):
+            language = fixed_language
+            if language is None and chunks:
+                language, _, _ = self._model.detect_language(audio=chunks[0])
+            by_language.setdefault(language, []).append(index)
+
+        per_group: list[list[Segment]] = [[] for _ in groups]
+        languages: list[str | None] = [None] * len(groups)
+        for language, indices in by_language.items():
+            segments = self._decode_batched([groups[index] for index in indices], language, batch_size)
+            for index, group_segments in zip(indices, segments):
+                per_group[index] = group_segments
+                languages[index] = language
+        return [
+            self._score_segments(segments, language, start)
+            for segments, language in zip(per_group, languages)
+        ]
+
+    def _decode_batched(
+        self, groups: Sequence[Sequence[np.ndarray]], language: str | None, batch_size: int,
+    ) -> list[list[Segment]]:
+        """Run one batched call over ``groups`` and split its segments per group."""
+        clips: list[dict[str, float]] = []
+        clip_starts: list[float] = []
+        clip_owners: list[int] = []
+        offset = 0
+        for index, chunks in enumerate(groups):
+            for chunk in chunks:
+                clip_start = offset / _SAMPLE_RATE
+                offset += len(chunk)
+                clips.append({"start": clip_start, "end": offset / _SAMPLE_RATE})
+                clip_starts.append(clip_start)
+                clip_owners.append(index)
+
+        per_group: list[list[Segment]] = [[] for _ in groups]
+        if not clips:
+            return per_group
+        audio = np.concatenate([chunk for chunks in groups for chunk in chunks])
+        segments, _ = self._batched.transcribe(
+            audio,
+            language=language,
+            batch_size=batch_size,
+            clip_timestamps=clips,
+            beam_size=self._beam_size,
+            log_prob_threshold=self._log_prob_threshold,
+            no_speech_threshold=self._no_speech_threshold,
+        )
+        for segment in list(segments):
+            # Segment starts are rounded to ms; allow for that at clip edges.
+            clip = max(0, bisect.bisect_right(clip_starts, segment.start + 1e-3) - 1)
+            per_group[clip_owners[clip]].append(segment)
+        return per_group
+
+    def _score_segments(
+        self, segments: Iterable[Segment], language: str | None, start: float,
+    ) -> TranscriptEvent:
+        """Drop no-speech/low-confidence segments and score the rest.
+
+        Segment confidence is ``exp(avg_logprob)``; the transcript confidence
+        is its duration-weighted mean over the kept segments.
+        """
+        texts: list[str] = []
+        weighted = 0.0
+        total_s = 0.0
+        skipped = 0
+        for segment in segments:
+            confidence = math.exp(min(0.0, segment.avg_logprob))
+            is_silence = (
+                segment.no_speech_prob > self._no_speech_threshold
+                and segment.avg_logprob < self._log_prob_threshold
+            )
+            text = segment.text.strip()
+            if is_silence or confidence < self._min_segment_confidence or not text:
+                skipped += 1
+                continue
+            duration = max(segment.end - segment.start, 1e-3)
+            texts.append(text)
+            weighted += confidence * duration
+            total_s += duration
         latency_ms = int((time.perf_counter() - start) * 1000)
-        confidence = float(max(0.0, min(1.0, info.language_probability)))
-        return TranscriptEvent(text=text, confidence=confidence, latency_ms=latency_ms)
+        return TranscriptEvent(
+            text=" ".join(texts).strip(),
+            confidence=weighted / total_s if total_s else 0.0,
+            latency_ms=latency_ms,
+            language=language,
+            skipped_segments=skipped,
+        )
 
     @staticmethod
     def _pcm_to_wav_bytes(pcm_bytes: bytes, sample_rate: int) -> bytes:
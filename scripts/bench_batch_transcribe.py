@@ -0,0 +1,73 @@
+"""Compare offline batch transcription throughput with per-file streaming decode.
+
+Runs the same folder twice with one loaded model: first feeding each file
+through ``transcribe_pcm16_mono`` one by one (the live push-to-talk path),
+then through ``BatchTranscriptionJob`` with cross-file batching. Reports
+audio seconds transcribed per wall-clock second for each.
+
+    PYTHONPATH=desktop_agent python scripts/bench_batch_transcribe.py ./voice_notes --batch-size 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from faster_whisper import decode_audio
+
+from mozhi_agent.pipeline.offline import BatchTranscriptionJob, discover_audio_files
+from mozhi_agent.risk.filter import RiskFilter
+from mozhi_agent.stt.transcriber import WhisperTranscriber
+
+
+def bench_sequential(transcriber: WhisperTranscriber, files: list[Path]) -> tuple[float, float]:
+    audio_s = 0.0
+    start = time.perf_counter()
+    for path in files:
+        audio = decode_audio(str(path), sampling_rate=16000)
+        audio_s += len(audio) / 16000
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+        transcriber.transcribe_pcm16_mono(pcm)
+    return audio_s, time.perf_counter() - start
+
+
+def bench_batched(
+    transcriber: WhisperTranscriber, files: list[Path], batch_size: int, workdir: Path,
+) -> float:
+    job = BatchTranscriptionJob(
+        transcriber, RiskFilter(workdir / "actions.log", True), batch_size=batch_size,
+    )
+    start = time.perf_counter()
+    job.run(files, workdir / "out.jsonl")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", type=Path)
+    parser.add_argument("--model-size", default="small")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--batch-size", type=int, default=8)
+    args = parser.parse_args()
+
+    files = list(discover_audio_files(args.input))
+    transcriber = WhisperTranscriber(
+        args.model_size, args.compute_type, args.language, cpu_threads=os.cpu_count() or 0,
+    )
+    audio_s, sequential_s = bench_sequential(transcriber, files)
+    with tempfile.TemporaryDirectory() as workdir:
+        batched_s = bench_batched(transcriber, files, args.batch_size, Path(workdir))
+
+    print(f"{len(files)} files, {audio_s:.1f}s audio")
+    print(f"sequential: {sequential_s:7.1f}s wall  {audio_s / sequential_s:6.1f}x realtime")
+    print(f"   batched: {batched_s:7.1f}s wall  {audio_s / batched_s:6.1f}x realtime")
+    print(f"   speed-up: {sequential_s / batched_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
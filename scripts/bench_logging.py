@@ -0,0 +1,80 @@
+"""Measure caller-side logging overhead per utterance, sync vs queue-backed.
+
+Each "utterance" emits the events the live pipeline logs for one chunk
+(``stt.completed`` with a full transcript plus a risk warning) into a sink
+that sleeps on every write, simulating a slow stdout pipe.
+
+    PYTHONPATH=desktop_agent python scripts/bench_logging.py --utterances 500 --write-delay-ms 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import structlog
+
+from mozhi_agent.observability.logging_utils import configure_logging
+
+TRANSCRIPT = (
+    "please open the deployment checklist and summarise the open items for the "
+    "release review tomorrow morning, then draft a short note to the team"
+)
+
+
+class SlowSink:
+    """Text stream whose writes block for a fixed delay."""
+
+    def __init__(self, delay_s: float) -> None:
+        self._delay_s = delay_s
+        self.lines = 0
+
+    def write(self, data: str) -> int:
+        time.sleep(self._delay_s)
+        self.lines += data.count("\n")
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def bench(mode: str, utterances: int, delay_s: float, transcript_mode: str) -> list[float]:
+    sink = SlowSink(delay_s)
+    listener = configure_logging(
+        "INFO",
+        async_mode=mode == "async",
+        transcript_mode=transcript_mode,
+        stream=sink,
+    )
+    logger = structlog.get_logger("bench")
+    samples: list[float] = []
+    for i in range(utterances):
+        start = time.perf_counter()
+        logger.info("stt.completed", text=TRANSCRIPT, confidence=0.91, latency_ms=420 + i % 50)
+        logger.warning("risk.blocked", keyword="deploy")
+        samples.append((time.perf_counter() - start) * 1e6)
+    if listener is not None:
+        listener.stop()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--utterances", type=int, default=500)
+    parser.add_argument("--write-delay-ms", type=float, default=1.0)
+    parser.add_argument("--transcript-mode", default="full", choices=("full", "truncate", "redact"))
+    args = parser.parse_args()
+
+    for mode in ("sync", "async"):
+        samples = bench(mode, args.utterances, args.write_delay_ms / 1000, args.transcript_mode)
+        samples.sort()
+        print(
+            f"{mode:>5}: mean={statistics.fmean(samples):8.1f}us "
+            f"p50={samples[len(samples) // 2]:8.1f}us "
+            f"p99={samples[int(len(samples) * 0.99)]:8.1f}us per utterance"
+        )
+
+
+if __name__ == "__main__":
+    main()